@@ -58,13 +58,32 @@ class ReviewSubmittedEvent(TypedDict):
 
 # analytics/client.py
 
+from datetime import datetime, timezone
 from typing import Dict, Any
+import requests
+from celery import shared_task
 from analytics_sdk import init
 
-# Initialize the analytics client
+
+@shared_task(
+    bind=True,
+    acks_late=True,
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=True,
+    queue="analytics",
+)
+def send_events(self, events):
+    """Deliver a batch of events from a Celery worker."""
+    analytics.send(events)
+
+
+# Initialize the analytics client. Full batches are handed to Celery, so
+# request threads never wait on the analytics API. Run a dedicated worker
+# for them with: celery -A <project> worker -Q analytics
 analytics = init(
     api_url="http://localhost:3001/api/v1",
-    api_key="dev_key_123"
+    api_key="dev_key_123",
+    dispatcher=send_events.delay,
 )
 
 def identify_user(user_id: str, email: str, account_type: str):
@@ -72,7 +91,7 @@ def identify_user(user_id: str, email: str, account_type: str):
     analytics.identify(user_id, {
         "email": email,
         "accountType": account_type,
-        "identifiedAt": __import__('datetime').datetime.now().isoformat(),
+        "identifiedAt": datetime.now(timezone.utc).isoformat(),
     })
 
 
@@ -80,14 +99,80 @@ def identify_user(user_id: str, email: str, account_type: str):
 # Step 3: Use analytics in your views
 # ============================================================
 
+# ecommerce/models.py (Product excerpt)
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models
+from django.db.models.functions import Upper
+
+
+class Product(models.Model):
+    name = models.CharField(max_length=255)
+    category = models.CharField(max_length=100)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    stock = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            # name__icontains compiles to UPPER("name"::text) LIKE UPPER(%s),
+            # so the trigram index has to be on that expression, not on name
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="product_name_trgm",
+            ),
+        ]
+
+
+# ecommerce/tasks.py
+
+from celery import shared_task
+from .models import Order
+from analytics.client import analytics
+
+
+@shared_task
+def ship_order_task(order_id):
+    """Simulate the order being shipped and track it."""
+    order = Order.objects.only("id").get(id=order_id)
+
+    analytics.track("order_shipped", {
+        "orderId": str(order.id),
+        "trackingNumber": f"TRACK{order.id}",
+        "carrier": "FedEx",
+    })
+
+
+# ecommerce/signals.py (connected from EcommerceConfig.ready)
+
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Product
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_product_cache(sender, instance, **kwargs):
+    """Drop the cached product so detail pages pick up the change."""
+    cache.delete(f"product:{instance.id}")
+
+
 # ecommerce/views.py
 
+import datetime
+
+import orjson
+import stripe
 from django.shortcuts import render, redirect
 from django.http import JsonResponse
+from django.core.cache import cache
+from django.db.models import Sum, F, Prefetch
 from django.views.decorators.http import require_http_methods
+from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
-from .models import Product, Order, Cart, Review
+from django.contrib.auth.models import User
+from .models import Product, Order, Cart, CartItem, Review
 from analytics.client import analytics, identify_user
+from .tasks import ship_order_task
 from analytics.events import (
     ProductViewedEvent,
     CheckoutStartedEvent,
@@ -101,7 +186,13 @@ from analytics.events import (
 @login_required
 def product_detail(request, product_id):
     """Product detail page with event tracking."""
-    product = Product.objects.get(id=product_id)
+    product = cache.get_or_set(
+        f"product:{product_id}",
+        lambda: Product.objects.only(
+            "id", "name", "category", "price", "stock"
+        ).get(id=product_id),
+        timeout=60,
+    )
     
     # Track product view
     analytics.track("product_viewed", {
@@ -119,12 +210,15 @@ def product_detail(request, product_id):
 def search_products(request):
     """Search products with event tracking."""
     query = request.GET.get("q", "")
-    results = Product.objects.filter(name__icontains=query)
+    # Served by the product_name_trgm index on UPPER(name) (see Product.Meta)
+    results = list(
+        Product.objects.filter(name__icontains=query).only("id", "name", "price")
+    )
     
     # Track search event
     analytics.track("product_search", {
         "searchQuery": query,
-        "resultsCount": results.count(),
+        "resultsCount": len(results),
         "filters": {"category": "all"},
     })
     
@@ -143,13 +237,14 @@ def add_to_cart(request):
     product_id = request.POST.get("product_id")
     quantity = int(request.POST.get("quantity", 1))
     
-    product = Product.objects.get(id=product_id)
+    product = Product.objects.only("id", "name", "price").get(id=product_id)
     cart, created = Cart.objects.get_or_create(user=request.user)
     
     # Add to cart logic...
     cart_item = cart.items.create(product=product, quantity=quantity)
     
-    cart_total = sum(item.product.price * item.quantity for item in cart.items.all())
+    agg = cart.items.aggregate(total=Sum(F("product__price") * F("quantity")))
+    cart_total = agg["total"] or 0
     
     # Track add to cart
     analytics.track("item_added_to_cart", {
@@ -166,7 +261,11 @@ def add_to_cart(request):
 @login_required
 def view_cart(request):
     """View shopping cart."""
-    cart = Cart.objects.get(user=request.user)
+    # Prefetch items with their products so the template's
+    # `cart.items.all` loop runs in two queries regardless of cart size.
+    cart = Cart.objects.prefetch_related(
+        Prefetch("items", queryset=CartItem.objects.select_related("product"))
+    ).get(user=request.user)
     return render(request, "cart/view.html", {"cart": cart})
 
 
@@ -176,9 +275,13 @@ def view_cart(request):
 @require_http_methods(["GET"])
 def checkout_page(request):
     """Checkout page with event tracking."""
-    cart = Cart.objects.get(user=request.user)
-    cart_value = sum(item.product.price * item.quantity for item in cart.items.all())
-    item_count = sum(item.quantity for item in cart.items.all())
+    cart = Cart.objects.only("id").get(user=request.user)
+    agg = cart.items.aggregate(
+        total=Sum(F("product__price") * F("quantity")),
+        count=Sum("quantity"),
+    )
+    cart_value = agg["total"] or 0
+    item_count = agg["count"] or 0
     promo_code = request.GET.get("promo", "")
     
     # Track checkout started
@@ -199,10 +302,7 @@ def checkout_page(request):
 @require_http_methods(["POST"])
 def process_payment(request):
     """Process payment with event tracking."""
-    import json
-    import stripe
-    
-    data = json.loads(request.body)
+    data = orjson.loads(request.body)
     payment_method = data.get("payment_method")  # "credit_card", "paypal", etc.
     
     # Track payment entered
@@ -216,9 +316,13 @@ def process_payment(request):
         # ... payment logic ...
         
         # Create order
-        cart = Cart.objects.get(user=request.user)
-        cart_value = sum(item.product.price * item.quantity for item in cart.items.all())
-        item_count = sum(item.quantity for item in cart.items.all())
+        cart = Cart.objects.only("id").get(user=request.user)
+        agg = cart.items.aggregate(
+            total=Sum(F("product__price") * F("quantity")),
+            count=Sum("quantity"),
+        )
+        cart_value = agg["total"] or 0
+        item_count = agg["count"] or 0
         
         order = Order.objects.create(
             user=request.user,
@@ -263,10 +367,11 @@ def process_payment(request):
 @login_required
 def order_confirmation(request, order_id):
     """Order confirmation page with event tracking."""
-    order = Order.objects.get(id=order_id, user=request.user)
+    order = Order.objects.only("id", "user_id", "total_amount").get(
+        id=order_id, user=request.user
+    )
     
     # Track order confirmed
-    import datetime
     analytics.track("order_confirmed", {
         "orderId": str(order.id),
         "estimatedDelivery": (
@@ -275,19 +380,7 @@ def order_confirmation(request, order_id):
     })
     
     # Simulate order shipped after a delay
-    # (In production, use Celery or similar)
-    def ship_order():
-        import time
-        time.sleep(2)
-        
-        analytics.track("order_shipped", {
-            "orderId": str(order.id),
-            "trackingNumber": f"TRACK{order.id}",
-            "carrier": "FedEx",
-        })
-    
-    import threading
-    threading.Thread(target=ship_order, daemon=True).start()
+    ship_order_task.apply_async(args=[order.id], countdown=2)
     
     return render(request, "order/confirmation.html", {"order": order})
 
@@ -298,13 +391,11 @@ def order_confirmation(request, order_id):
 @require_http_methods(["POST"])
 def submit_review(request, product_id):
     """Submit product review with event tracking."""
-    import json
-    
-    data = json.loads(request.body)
+    data = orjson.loads(request.body)
     rating = int(data.get("rating"))
     review_text = data.get("reviewText", "")
     
-    product = Product.objects.get(id=product_id)
+    product = Product.objects.only("id").get(id=product_id)
     
     # Create review
     review = Review.objects.create(
@@ -334,8 +425,6 @@ def signup(request):
         plan = request.POST.get("plan", "free")  # free, pro, enterprise
         signup_method = request.POST.get("method", "email")  # email, google, github
         
-        from django.contrib.auth.models import User
-        
         # Create user
         user = User.objects.create_user(
             username=email,
@@ -352,7 +441,6 @@ def signup(request):
         })
         
         # Log user in
-        from django.contrib.auth import login
         login(request, user)
         
         return redirect("products:list")
@@ -360,6 +448,33 @@ def signup(request):
     return render(request, "auth/signup.html")
 
 
+# ecommerce/migrations/0002_product_name_trgm.py
+
+from django.db import migrations
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import TrigramExtension
+
+
+class Migration(migrations.Migration):
+    """Trigram index so `name__icontains` searches avoid a sequential scan."""
+
+    dependencies = [
+        ("ecommerce", "0001_initial"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="product",
+            index=GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="product_name_trgm",
+            ),
+        ),
+    ]
+
+
 # ============================================================
 # Step 4: Django URL Configuration
 # ============================================================
@@ -1,15 +1,38 @@
 """Python SDK for service-analytics event tracking."""
 
+import atexit
+import secrets
 import time
 import threading
-from typing import Dict, Any, Optional
+import weakref
+from collections import deque
+from typing import Callable, Dict, Any, List, Optional
+import orjson
 import requests
 
+# Open clients, held weakly so dropping a client lets it be collected
+_clients: "weakref.WeakSet[Analytics]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_clients() -> None:
+    """Flush any clients still open at interpreter exit."""
+    for client in list(_clients):
+        client.close()
+
 
 class Analytics:
     """Analytics client for Python applications."""
 
-    def __init__(self, api_url: str, api_key: str, batch_size: int = 10, flush_interval: int = 5):
+    def __init__(
+        self,
+        api_url: str,
+        api_key: str,
+        batch_size: int = 10,
+        flush_interval: int = 5,
+        max_queue_size: int = 10000,
+        dispatcher: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+    ):
         """
         Initialize analytics client.
 
@@ -18,17 +41,28 @@ class Analytics:
             api_key: API key for authentication
             batch_size: Number of events to batch before sending
             flush_interval: Seconds between automatic flushes
+            max_queue_size: Maximum events held in memory; oldest are dropped first
+            dispatcher: Optional callable that takes over delivery of each batch
+                (e.g. enqueueing a task queue job); defaults to ``send``
         """
         self.api_url = api_url
         self.api_key = api_key
         self.batch_size = batch_size
         self.flush_interval = flush_interval
-        self.queue = []
+        self.max_queue_size = max_queue_size
+        self.dispatcher = dispatcher or self.send
+        self.queue = deque(maxlen=max_queue_size)
         self.user_id = None
         self.session_id = self._generate_session_id()
         self.lock = threading.Lock()
+        self._session = requests.Session()
         self.flush_thread = None
+        self._stop = threading.Event()
         self._start_flush_timer()
+        # Stop the timer thread if the client is collected without close().
+        # Not run at exit, where _close_clients flushes and stops it instead.
+        weakref.finalize(self, self._stop.set).atexit = False
+        _clients.add(self)
 
     def identify(self, user_id: str, traits: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -58,43 +92,80 @@ class Analytics:
 
         with self.lock:
             self.queue.append(event)
+            should_flush = len(self.queue) >= self.batch_size
 
-            if len(self.queue) >= self.batch_size:
-                self.flush()
+        if should_flush:
+            self.flush()
 
     def flush(self) -> None:
         """Flush queued events to server."""
         if not self.queue:
             return
 
+        # Swap in a fresh queue so producers only wait on the pointer swap
         with self.lock:
-            events = self.queue.copy()
-            self.queue.clear()
+            events, self.queue = self.queue, deque(maxlen=self.max_queue_size)
 
         try:
-            response = requests.post(
-                f"{self.api_url}/api/v1/events",
-                json={"events": events},
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": self.api_key,
-                },
-                timeout=10,
-            )
-            response.raise_for_status()
+            self.dispatcher(list(events))
         except Exception as e:
             print(f"Failed to send events: {e}")
-            # Re-add events to queue on failure
+            # Re-add events to the front of the queue, dropping the oldest
+            # ones if the backend has been down long enough to fill it
             with self.lock:
-                self.queue = events + self.queue
+                room = self.max_queue_size - len(self.queue)
+                for _ in range(len(events) - room):
+                    events.popleft()
+                self.queue.extendleft(reversed(events))
+
+    def send(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Send a batch of events to the server.
+
+        Args:
+            events: Events to send
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        response = self._session.post(
+            f"{self.api_url}/api/v1/events",
+            data=orjson.dumps({"events": events}),
+            headers={
+                "Content-Type": "application/json",
+                "x-api-key": self.api_key,
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+
+    def close(self) -> None:
+        """Stop the flush timer, send remaining events and close the session."""
+        if self._stop.is_set():
+            return
+
+        self._stop.set()
+        _clients.discard(self)
+        if self.flush_thread is not None:
+            self.flush_thread.join(timeout=5)
+        self.flush()
+        self._session.close()
 
     def _start_flush_timer(self) -> None:
         """Start background flush timer."""
 
+        # The thread only holds a weak reference so it doesn't keep the client alive
+        client_ref = weakref.ref(self)
+        stop = self._stop
+        interval = self.flush_interval
+
         def flush_periodically():
-            while True:
-                time.sleep(self.flush_interval)
-                self.flush()
+            while not stop.wait(interval):
+                client = client_ref()
+                if client is None:
+                    return
+                client.flush()
+                del client
 
         self.flush_thread = threading.Thread(target=flush_periodically, daemon=True)
         self.flush_thread.start()
@@ -102,11 +173,9 @@ class Analytics:
     @staticmethod
     def _generate_session_id() -> str:
         """Generate unique session ID."""
-        import uuid
-
-        return f"session-{uuid.uuid4()}"
+        return f"session-{secrets.token_hex(16)}"
 
 
-def init(api_url: str, api_key: str) -> Analytics:
+def init(api_url: str, api_key: str, **kwargs: Any) -> Analytics:
     """Initialize analytics client."""
-    return Analytics(api_url, api_key)
+    return Analytics(api_url, api_key, **kwargs)
@@ -0,0 +1,129 @@
+"""Test suite for the analytics client."""
+
+import gc
+import os
+import subprocess
+import sys
+import weakref
+
+import pytest
+from analytics_sdk import Analytics
+
+
+def failing_dispatcher(events):
+    """Dispatcher that always fails to deliver."""
+    raise RuntimeError("backend down")
+
+
+def queued_ids(client):
+    """Return the ``i`` property of each queued event, oldest first."""
+    return [event["properties"]["i"] for event in client.queue]
+
+
+@pytest.fixture
+def make_client():
+    """Create clients whose timer never fires during a test."""
+    clients = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("dispatcher", failing_dispatcher)
+        client = Analytics("http://test", "key", flush_interval=3600, **kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+def test_failed_batch_requeued_before_newer_events(make_client):
+    """Test a failed batch goes back ahead of events tracked during the send."""
+    client = None
+
+    def dispatcher(events):
+        client.track("event", {"i": 3})
+        raise RuntimeError("backend down")
+
+    client = make_client(batch_size=100, dispatcher=dispatcher)
+    for i in range(3):
+        client.track("event", {"i": i})
+
+    client.flush()
+    assert queued_ids(client) == [0, 1, 2, 3]
+
+
+def test_repeated_failures_keep_newest_events(make_client):
+    """Test the queue stays capped and drops the oldest events first."""
+    client = make_client(batch_size=3, max_queue_size=5)
+    for i in range(7):
+        client.track("event", {"i": i})
+    client.flush()
+    client.flush()
+
+    assert queued_ids(client) == [2, 3, 4, 5, 6]
+
+
+def test_successful_flush_delivers_in_order(make_client):
+    """Test a recovered backend receives queued events in order."""
+    sent = []
+    client = make_client(batch_size=100, dispatcher=sent.extend)
+    for i in range(3):
+        client.track("event", {"i": i})
+
+    client.flush()
+    assert [event["properties"]["i"] for event in sent] == [0, 1, 2]
+    assert not client.queue
+
+
+def test_close_stops_timer_and_flushes(make_client):
+    """Test close() stops the flush thread and sends remaining events."""
+    sent = []
+    client = make_client(batch_size=100, dispatcher=sent.extend)
+    client.track("event", {"i": 0})
+
+    client.close()
+    assert not client.flush_thread.is_alive()
+    assert [event["properties"]["i"] for event in sent] == [0]
+    assert not client.queue
+
+
+def test_close_closes_session(make_client, monkeypatch):
+    """Test close() releases pooled connections after the final flush."""
+    calls = []
+    client = make_client(dispatcher=lambda events: calls.append("flush"))
+    monkeypatch.setattr(client._session, "close", lambda: calls.append("close"))
+    client.track("event", {"i": 0})
+
+    client.close()
+    assert calls == ["flush", "close"]
+
+
+def test_dropped_client_is_collected():
+    """Test an unclosed client isn't kept alive by its thread or exit hook."""
+    client = Analytics("http://test", "key", flush_interval=3600)
+    thread = client.flush_thread
+    client_ref = weakref.ref(client)
+
+    del client
+    gc.collect()
+    assert client_ref() is None
+
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+def test_open_client_flushed_at_exit():
+    """Test events still queued at interpreter exit are sent."""
+    script = (
+        "from analytics_sdk import init\n"
+        "client = init('http://test', 'key', dispatcher=lambda e: print(len(e)))\n"
+        "client.track('event')\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        check=True,
+    )
+    assert result.stdout.strip() == "1"
@@ -2,9 +2,14 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from ai_agent.routes import explain, insights
 
-app = FastAPI(title="Analytics AI Agent", version="1.0.0")
+app = FastAPI(
+    title="Analytics AI Agent",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Enable CORS
 app.add_middleware(
@@ -1,20 +1,54 @@
 """AI models for analytics insights."""
 
 from typing import Optional
-from pydantic import BaseModel
+
+import numpy as np
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+# Request models accept the API's camelCase keys as well as field names
+_REQUEST_CONFIG = ConfigDict(
+    alias_generator=to_camel,
+    populate_by_name=True,
+    extra="forbid",
+    frozen=True,
+)
+
+
+class FunnelStep(BaseModel):
+    """Single funnel step (shared-types ``FunnelStep``)."""
+
+    model_config = _REQUEST_CONFIG
+
+    step: int
+    event_name: str
+    count: int
+    drop_off: Optional[int] = None
+    drop_off_rate: Optional[float] = None
 
 
 class FunnelData(BaseModel):
-    """Funnel analytics data."""
+    """Funnel analytics data (shared-types ``FunnelAnalytics``)."""
+
+    model_config = _REQUEST_CONFIG
 
-    steps: list[dict]
+    workflow_id: Optional[str] = None
+    steps: list[FunnelStep]
+    total_users: Optional[int] = None
     conversion_rate: float
-    drop_off_points: list[dict]
+    drop_off_points: list[FunnelStep] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices(
+            "dropOffPoints", "bottomDropOff", "drop_off_points"
+        ),
+    )
 
 
 class ExplanationRequest(BaseModel):
     """Request for funnel explanation."""
 
+    model_config = _REQUEST_CONFIG
+
     workflow_id: str
     funnel_data: FunnelData
 
@@ -22,6 +56,8 @@ class ExplanationRequest(BaseModel):
 class AnomalyRequest(BaseModel):
     """Request for anomaly detection."""
 
+    model_config = _REQUEST_CONFIG
+
     workflow_id: str
     time_period: str = "24h"
     sensitivity: float = 0.8
@@ -43,11 +79,34 @@ class FunnelExplainer:
         # Call LLM to generate explanation
         explanation = {
             "summary": "Funnel analysis summary",
-            "drop_off_analysis": [],
+            "drop_off_analysis": self._drop_off_rates(request.funnel_data.steps),
             "suggestions": [],
         }
         return explanation
 
+    @staticmethod
+    def _drop_off_rates(steps: list[FunnelStep]) -> list[dict]:
+        """Compute the drop-off rate into each step after the first."""
+        if len(steps) < 2:
+            return []
+
+        counts = np.fromiter(
+            (s.count for s in steps), dtype=np.int64, count=len(steps)
+        )
+        prev = counts[:-1]
+        # Steps following an empty step are reported as no drop-off
+        kept = np.divide(counts[1:], prev, out=np.ones(len(prev)), where=prev > 0)
+        drops = 1.0 - kept
+
+        return [
+            {
+                "step": step.step,
+                "event_name": step.event_name,
+                "drop_off_rate": float(rate),
+            }
+            for step, rate in zip(steps[1:], drops)
+        ]
+
 
 class AnomalyDetector:
     """Detects anomalies in event streams."""
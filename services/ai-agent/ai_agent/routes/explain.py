@@ -1,18 +1,30 @@
 """Funnel explanation routes."""
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from ai_agent.models.funnel_explainer import FunnelExplainer, ExplanationRequest
 
 router = APIRouter()
 explainer = FunnelExplainer()
 
 
+class DropOffAnalysis(BaseModel):
+    """Drop-off rate into a funnel step."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    step: int
+    event_name: str
+    drop_off_rate: float
+
+
 class FunnelExplanationResponse(BaseModel):
     """Funnel explanation response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     summary: str
-    drop_off_analysis: list[dict]
+    drop_off_analysis: list[DropOffAnalysis]
     suggestions: list[str]
 
 
@@ -1,7 +1,8 @@
 """Insights generation routes."""
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from pydantic.alias_generators import to_camel
 
 router = APIRouter()
 
@@ -9,6 +10,13 @@ router = APIRouter()
 class InsightRequest(BaseModel):
     """Request for AI insights."""
 
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        extra="forbid",
+        frozen=True,
+    )
+
     workflow_id: str
     time_period: str = "7d"
 
@@ -16,6 +24,8 @@ class InsightRequest(BaseModel):
 class InsightResponse(BaseModel):
     """AI insight response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     insights: list[str]
     confidence: float
     recommendations: list[str]
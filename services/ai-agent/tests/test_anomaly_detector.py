@@ -0,0 +1,63 @@
+"""Test suite for anomaly detection."""
+
+import numpy as np
+import pytest
+from ai_agent.models.anomaly_detector import AnomalyDetectionModel
+
+
+@pytest.fixture
+def detector():
+    """Create detector instance."""
+    return AnomalyDetectionModel(sensitivity=0.5)
+
+
+@pytest.mark.asyncio
+async def test_detect_event_anomalies(detector):
+    """Test that a spike is flagged against its trailing window."""
+    events = [
+        {"timestamp": i * 60, "value": 10.0 + (i % 3)} for i in range(30)
+    ]
+    events.append({"timestamp": 30 * 60, "value": 100.0})
+
+    anomalies = await detector.detect_event_anomalies(events, time_window="1h")
+    assert len(anomalies) == 1
+    assert anomalies[0]["value"] == 100.0
+    assert anomalies[0]["z_score"] > detector.z_threshold
+
+
+@pytest.mark.asyncio
+async def test_detect_event_anomalies_large_baseline(detector):
+    """Test a spike is still found when values sit on a large offset."""
+    events = [
+        {"timestamp": i * 60, "value": 1e9 + (i % 3)} for i in range(30)
+    ]
+    events.append({"timestamp": 30 * 60, "value": 1e9 + 20})
+
+    anomalies = await detector.detect_event_anomalies(events, time_window="1h")
+    assert len(anomalies) == 1
+    assert anomalies[0]["value"] == 1e9 + 20
+    assert anomalies[0]["z_score"] == pytest.approx(23.27, rel=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_detect_event_anomalies_gaussian_noise():
+    """Test stationary noise yields almost no anomalies at default sensitivity."""
+    values = np.random.default_rng(0).normal(100.0, 5.0, 2000)
+    events = [{"timestamp": i * 10, "value": v} for i, v in enumerate(values)]
+
+    anomalies = await AnomalyDetectionModel().detect_event_anomalies(events)
+    assert len(anomalies) / len(events) < 0.01
+
+
+@pytest.mark.asyncio
+async def test_detect_event_anomalies_empty(detector):
+    """Test that no events yields no anomalies."""
+    assert await detector.detect_event_anomalies([]) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("time_window", ["-1h", "0m", "nanh", "1w", ""])
+async def test_detect_event_anomalies_invalid_window(detector, time_window):
+    """Test malformed or non-positive windows are rejected."""
+    with pytest.raises(ValueError):
+        await detector.detect_event_anomalies([], time_window=time_window)
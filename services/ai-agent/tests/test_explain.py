@@ -2,6 +2,7 @@
 
 import pytest
 from ai_agent.models.funnel_explainer import FunnelExplainer, ExplanationRequest, FunnelData
+from ai_agent.routes.explain import FunnelExplanationResponse
 
 
 @pytest.fixture
@@ -17,14 +18,19 @@ async def test_explain_funnel(explainer):
         workflow_id="test-workflow",
         funnel_data=FunnelData(
             steps=[
-                {"step": 1, "event": "page_view", "count": 1000},
-                {"step": 2, "event": "add_to_cart", "count": 300},
-                {"step": 3, "event": "checkout", "count": 100},
+                {"step": 1, "eventName": "page_view", "count": 1000, "dropOff": 0},
+                {"step": 2, "eventName": "add_to_cart", "count": 300, "dropOff": 700},
+                {"step": 3, "eventName": "checkout", "count": 100, "dropOff": 200},
             ],
             conversion_rate=0.1,
             drop_off_points=[
-                {"step": 1, "drop_off": 70},
-                {"step": 2, "drop_off": 67},
+                {
+                    "step": 2,
+                    "eventName": "add_to_cart",
+                    "count": 300,
+                    "dropOff": 700,
+                    "dropOffRate": 0.7,
+                },
             ],
         ),
     )
@@ -33,3 +39,65 @@ async def test_explain_funnel(explainer):
     assert "summary" in result
     assert "drop_off_analysis" in result
     assert "suggestions" in result
+    FunnelExplanationResponse.model_validate(result)
+
+
+@pytest.mark.asyncio
+async def test_explain_funnel_drop_off_rates(explainer):
+    """Test drop-off rates are computed between consecutive steps."""
+    request = ExplanationRequest(
+        workflow_id="test-workflow",
+        funnel_data=FunnelData(
+            steps=[
+                {"step": 1, "eventName": "page_view", "count": 1000},
+                {"step": 2, "eventName": "add_to_cart", "count": 300},
+                {"step": 3, "eventName": "checkout", "count": 0},
+                {"step": 4, "eventName": "purchase", "count": 0},
+            ],
+            conversion_rate=0.0,
+            drop_off_points=[],
+        ),
+    )
+
+    result = await explainer.explain_funnel(request)
+    rates = [d["drop_off_rate"] for d in result["drop_off_analysis"]]
+    assert [d["event_name"] for d in result["drop_off_analysis"]] == [
+        "add_to_cart",
+        "checkout",
+        "purchase",
+    ]
+    assert rates == pytest.approx([0.7, 1.0, 0.0])
+
+
+def test_funnel_step_accepts_snake_case_names():
+    """Test steps can also be populated by field name."""
+    data = FunnelData(
+        steps=[{"step": 1, "event_name": "page_view", "count": 10, "drop_off": 0}],
+        conversion_rate=1.0,
+        drop_off_points=[],
+    )
+    assert data.steps[0].event_name == "page_view"
+    assert data.steps[0].drop_off == 0
+
+
+def test_explanation_request_accepts_shared_funnel_analytics():
+    """Test the camelCase FunnelAnalytics shape from the API validates as-is."""
+    step = {"step": 2, "eventName": "add_to_cart", "count": 300, "dropOff": 700}
+    request = ExplanationRequest.model_validate(
+        {
+            "workflowId": "checkout",
+            "funnelData": {
+                "workflowId": "checkout",
+                "steps": [
+                    {"step": 1, "eventName": "page_view", "count": 1000},
+                    step,
+                ],
+                "totalUsers": 1000,
+                "conversionRate": 0.3,
+                "bottomDropOff": [step],
+            },
+        }
+    )
+    assert request.workflow_id == "checkout"
+    assert request.funnel_data.total_users == 1000
+    assert request.funnel_data.drop_off_points[0].drop_off == 700